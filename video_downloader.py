@@ -1,15 +1,34 @@
 import os
-import pandas as pd
+import csv
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import time
 import subprocess
+import shutil
 import sys
 import logging
+import xml.etree.ElementTree as ET
+import threading
+import queue
+from array import array
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
 
+logger = logging.getLogger(__name__)
+
+_STOP = object()  # tells the progress writer thread to flush and exit
+
+
+class ProxyUnavailableError(Exception):
+    """Raised when the proxy API keeps failing and no proxy IP can be fetched."""
+
 
 class VideoDownloader:
+    PROXY_TTL = 300  # seconds a fetched proxy IP is used before refreshing
+    PROGRESS_BATCH_SIZE = 100  # completed avids written to progress_log.txt per write()
+    PROGRESS_FLUSH_INTERVAL = 1.0  # seconds a completed avid may wait before it is written
+
     def __init__(self, ip_url, csv_file_path, output_dir, batch_name):
         self.ip_url = ip_url
         self.csv_file_path = csv_file_path
@@ -17,160 +36,413 @@ class VideoDownloader:
         os.makedirs(self.output_dir, exist_ok=True)
         self.error_log_path = os.path.join(output_dir, 'error_log.txt')
         self.progress_log_path = os.path.join(output_dir, 'progress_log.txt')
+        # Packed int64 copy of everything progress_log.txt held when the last run started
+        self.progress_bin_path = os.path.join(output_dir, 'progress_log.bin')
+        self.max_workers = int(os.environ.get("YUTTO_WORKERS", 8))
+        self.post_workers = int(os.environ.get("YUTTO_POST_WORKERS", 2))
+        # Pausing at checkpoints is opt-in and only offered when someone can answer the prompt
+        self.interactive = sys.stdin.isatty() and bool(os.environ.get("YUTTO_INTERACTIVE"))
+        self._resume = threading.Event()  # cleared while an interactive checkpoint is waiting
+        self._resume.set()
+        # Bounds how many downloaded avids may wait for cover extraction before downloads pause
+        self._post_slots = threading.BoundedSemaphore(self.post_workers * 2)
+        # Resolved once up front instead of searching PATH on every spawn
+        self.yutto_path = shutil.which('yutto') or 'yutto'
+        self.ffmpeg_path = shutil.which('ffmpeg') or 'ffmpeg'
+        self._log_lock = threading.Lock()  # the error log is shared by all workers
+        self._error_count = 0
+        # (proxy, fetch_time) is swapped as one tuple so workers can read it without locking;
+        # the lock only serialises refreshes
+        self._proxy_state = (None, 0.0)
+        self._proxy_lock = threading.Lock()
+        self._proxy_failed = False  # set under _proxy_lock once get_ip has given up
+        # Reused for proxy-API calls and cover downloads so connections (and TLS sessions) stay alive
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        # Kept open for the whole run (line-buffered) instead of reopening per avid
+        self._error_fp = open(self.error_log_path, 'a', buffering=1)
+        # Only the writer thread touches progress_log.txt; workers just queue completed avids
+        self._progress_fp = open(self.progress_log_path, 'a')
+        self._progress_queue = queue.Queue()
+        self._progress_thread = threading.Thread(target=self._progress_writer, name='progress-writer', daemon=True)
+        self._progress_thread.start()
         log_file_path = os.path.join(output_dir, f'{batch_name}_log.txt')
         logging.basicConfig(level=logging.INFO, 
                             format='%(asctime)s - %(levelname)s - %(message)s', 
                             filename=log_file_path,  # Save the log to a file
                             filemode='a')
-        logging.info("VideoDownloader initialized.")
+        logger.info("VideoDownloader initialized.")
 
     def log_error(self, avid):
-        with open(self.error_log_path, 'a') as f:
-            f.write(f"{avid}\n")
-        logging.error(f"Recorded error for avid: {avid}")
+        with self._log_lock:
+            self._error_fp.write(f"{avid}\n")
+            self._error_count += 1
+        logger.error(f"Recorded error for avid: {avid}")
 
     def log_progress(self, completed_avid):
-        with open(self.progress_log_path, 'a') as f:
-            f.write(f"{completed_avid}\n")
+        self._progress_queue.put(completed_avid)
+
+    def _progress_writer(self):
+        # Collects completed avids and writes them with one write() per batch: when the batch
+        # is full or PROGRESS_FLUSH_INTERVAL after its first avid arrived, whichever comes first
+        batch = []
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+            try:
+                avid = self._progress_queue.get(timeout=timeout)
+            except queue.Empty:
+                pass
+            else:
+                if avid is _STOP:
+                    self._write_progress(batch)
+                    return
+                batch.append(avid)
+                if deadline is None:
+                    deadline = time.monotonic() + self.PROGRESS_FLUSH_INTERVAL
+                if len(batch) < self.PROGRESS_BATCH_SIZE and time.monotonic() < deadline:
+                    continue
+            if self._write_progress(batch):
+                batch = []
+                deadline = None
+            else:
+                # Keep the batch and try again later rather than letting the thread die
+                deadline = time.monotonic() + self.PROGRESS_FLUSH_INTERVAL
+
+    def _write_progress(self, batch):
+        if not batch:
+            return True
+        try:
+            self._progress_fp.write("".join(f"{avid}\n" for avid in batch))
+            self._progress_fp.flush()
+        except Exception as e:
+            logger.error(f"Failed to write {len(batch)} completed avids to {self.progress_log_path}: {e}")
+            return False
+        return True
+
+    def flush_logs(self):
+        # progress_log.txt is flushed by its writer thread after every batch
+        with self._log_lock:
+            self._error_fp.flush()
+
+    def close(self):
+        self._progress_queue.put(_STOP)
+        self._progress_thread.join()
+        self._progress_fp.close()
+        with self._log_lock:
+            self._error_fp.close()
+        self._session.close()
 
     def load_progress(self):
+        completed = array('q')
+        if os.path.exists(self.progress_bin_path):
+            with open(self.progress_bin_path, 'rb') as f:
+                completed.frombytes(f.read())
+        completed_avids = set(completed)
+
         if os.path.exists(self.progress_log_path):
-            with open(self.progress_log_path, 'r') as f:
-                return set(int(line.strip()) for line in f if line.strip())
-        return set()
+            with open(self.progress_log_path, 'rb') as f:
+                # One bulk read + split; blank lines vanish without a per-line strip()
+                logged_avids = set(map(int, f.read().split()))
+            if logged_avids:
+                completed_avids |= logged_avids
+                self._compact_progress(completed_avids)
+        return completed_avids
+
+    def _compact_progress(self, completed_avids):
+        # Folds the text log into the binary file so the next start only parses this run's
+        # additions. The new file is swapped in atomically; a crash before the truncate
+        # merely leaves ids in both files, which the set absorbs.
+        tmp_path = self.progress_bin_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            array('q', completed_avids).tofile(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.progress_bin_path)
+        self._progress_fp.truncate(0)
+        logger.info(f"Compacted {len(completed_avids)} completed avids into {self.progress_bin_path}")
 
     def get_ip(self, ip_url):
         max_retries = 5
         for attempt in range(max_retries):
             try:
-                logging.info(f"Attempting to fetch IP (Attempt {attempt + 1})...")
-                ip = requests.get(ip_url).text
+                logger.info(f"Attempting to fetch IP (Attempt {attempt + 1})...")
+                ip = self._session.get(ip_url, timeout=5).text
                 ip = json.loads(ip)
                 if ip['ret'] == 200:
-                    logging.info(f"Successfully fetched IP: {ip['data'][0]}")
+                    logger.info(f"Successfully fetched IP: {ip['data'][0]}")
                     break
-                logging.warning("Failed to get IP, retrying...")
+                logger.warning("Failed to get IP, retrying...")
                 time.sleep(5)
             except Exception as e:
-                logging.error(f"Error getting IP: {e}")
+                logger.error(f"Error getting IP: {e}")
                 time.sleep(5)
         else:
-            logging.error("Max retries reached, exiting.")
-            sys.exit(1)
+            logger.error("Max retries reached, exiting.")
+            raise ProxyUnavailableError(f"No proxy IP after {max_retries} attempts")
 
         proxy = "http://%(ip)s:%(port)s" % {
             "ip": ip['data'][0]['ip'],
             "port": ip['data'][0]['port']
         }
-        self.proxy = proxy
-        self.proxy_fetch_time = time.time()  # Record the time the IP was fetched
-        logging.info(f"Using proxy: {proxy}")
+        self._proxy_state = (proxy, time.time())  # Record the time the IP was fetched
+        logger.info(f"Using proxy: {proxy}")
         return proxy
 
+    @property
+    def proxy(self):
+        return self._proxy_state[0]
+
     def check_ip_validity(self):
-        if self.proxy is None or (time.time() - self.proxy_fetch_time) > 300:  
-            logging.info("Proxy IP is expired or not set, fetching a new one.")
-            self.proxy = self.get_ip(self.ip_url)
+        proxy, fetch_time = self._proxy_state
+        if proxy is None or (time.time() - fetch_time) > self.PROXY_TTL:
+            with self._proxy_lock:
+                # Another worker may have refreshed it, or already given up, while we were waiting
+                if self._proxy_failed:
+                    raise ProxyUnavailableError("Proxy API already failed in another worker")
+                proxy, fetch_time = self._proxy_state
+                if proxy is None or (time.time() - fetch_time) > self.PROXY_TTL:
+                    logger.info("Proxy IP is expired or not set, fetching a new one.")
+                    try:
+                        proxy = self.get_ip(self.ip_url)
+                    except ProxyUnavailableError:
+                        self._proxy_failed = True
+                        raise
+        return proxy
     
     def run(self):
         try:
-            logging.info(f"Reading CSV file: {self.csv_file_path}")
-            avid_df = pd.read_csv(self.csv_file_path)
-            avid_list = avid_df['avid'].unique().tolist()
+            logger.info(f"Reading CSV file: {self.csv_file_path}")
+            # utf-8-sig: same default as pandas, and strips the BOM Excel puts before 'avid'
+            with open(self.csv_file_path, newline='', encoding='utf-8-sig') as f:
+                # dict.fromkeys drops duplicates while keeping the CSV order
+                avid_list = list(dict.fromkeys(int(row['avid']) for row in csv.DictReader(f)))
             completed_avids = self.load_progress()
 
-            remaining_avids = [avid for avid in avid_list if avid not in completed_avids]
-            logging.info(f"Total {len(avid_list)} videos, {len(remaining_avids)} remaining.")
+            remaining_set = set(avid_list).difference(completed_avids)
+            # Keep the CSV order for submission; membership in the (usually smaller) set is cheap
+            remaining_avids = [avid for avid in avid_list if avid in remaining_set] if remaining_set else []
+            logger.info(f"Total {len(avid_list)} videos, {len(remaining_avids)} remaining.")
             total_videos = len(avid_list)
             completed_count = len(completed_avids)
            #proxy = self.get_ip(self.ip_url)  # Fetch the initial proxy
             self.get_ip(self.ip_url)
 
             with tqdm(total=total_videos, initial=completed_count, desc="Downloading Videos", unit="video") as pbar:
-                for index, avid in enumerate(remaining_avids, start=1):
-                    self.check_ip_validity() 
-                    
-                    logging.info(f"Processing avid {avid} ({index}/{len(remaining_avids)})...")
+                # Each avid is an independent task; workers pull the next one as soon as they are
+                # free, so a slow video never holds up a whole chunk. Downloads (network-bound) and
+                # cover extraction (ffmpeg) use separate pools so the two stages overlap. The post
+                # pool is entered first so that it outlives the download workers feeding it.
+                with ThreadPoolExecutor(max_workers=self.post_workers) as post_pool, \
+                        ThreadPoolExecutor(max_workers=self.max_workers) as download_pool:
+                    futures = {download_pool.submit(self._download_avid, avid, post_pool): avid
+                               for avid in remaining_avids}
                     try:
-                        merge_path, audio_only_path, video_only_path = self.create_directories(avid)
-                        self.generate_and_run_commands(avid, self.proxy, merge_path, audio_only_path, video_only_path)
-                        
-                        for root, _, files in os.walk(merge_path):
-                            for file in files:
-                                if file.endswith('.mp4'):
-                                    video_path = os.path.join(root, file)
-                                    self.extract_cover_image(video_path)
-                        self.log_progress(avid)
-                        
-                        pbar.update(1)
-
-                        if index % 1000 == 0:
-                            elapsed_time = time.time() - self.start_time
-                            print(f"Downloaded {index} files in {elapsed_time:.2f} seconds. Press any key to continue...")
-                            input()
-                        
-                    except Exception as e:
-                        logging.error(f"An error occurred for avid {avid}: {e}")
-                        self.log_error(avid)  # 
+                        # These are download-stage futures: the bar and checkpoints count downloads,
+                        # which may run ahead of cover extraction and progress_log.txt
+                        for index, future in enumerate(as_completed(futures), start=1):
+                            future.result()
+                            pbar.update(1)
+
+                            if index % 1000 == 0:
+                                self.checkpoint(index)
+                    except BaseException:
+                        # Already-queued cover extractions are left to finish so their progress is kept
+                        download_pool.shutdown(wait=False, cancel_futures=True)
+                        raise
         except FileNotFoundError as e:
-            logging.error(f"CSV file not found: {self.csv_file_path}. Error: {e}")
+            logger.error(f"CSV file not found: {self.csv_file_path}. Error: {e}")
+            sys.exit(1)
+        except ProxyUnavailableError as e:
+            logger.error(f"Stopping, proxy unavailable: {e}")
             sys.exit(1)
         except Exception as e:
-            logging.error(f"An unexpected error occurred: {e}")
+            logger.error(f"An unexpected error occurred: {e}")
             sys.exit(1)
+        finally:
+            self.close()
+
+
+    def checkpoint(self, index):
+        elapsed_time = time.time() - self.start_time
+        self.flush_logs()
+        # Per-avid messages are DEBUG only; this is the regular INFO summary
+        logger.info(f"Checkpoint: downloaded {index} videos ({self._error_count} errors logged) "
+                    f"in {elapsed_time:.1f}s (rate={index / elapsed_time:.2f}/s).")
+        if self.interactive:
+            # Workers finish the avid they are on and then wait until the user resumes
+            self._resume.clear()
+            try:
+                input(f"Downloaded {index} files in {elapsed_time:.2f} seconds. Press Enter to continue...")
+            finally:
+                self._resume.set()
+
+    def _download_avid(self, avid, post_pool):
+        self._resume.wait()
+        proxy = self.check_ip_validity()
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Processing avid {avid}...")
+        try:
+            merge_path = self.create_directories(avid)
+            if self._has_finished_videos(merge_path):
+                # Completed by an earlier run that stopped before progress_log.txt recorded it
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Avid {avid} already has its video and cover, skipping download.")
+                self.log_progress(avid)
+                return
+
+            before = self._snapshot_mp4s(merge_path)
+            self.generate_and_run_commands(avid, proxy, merge_path)
+
+            # Only the mp4s yutto just created or overwrote (-w) need a cover
+            video_paths = [os.path.join(merge_path, name)
+                           for name, mtime in self._snapshot_mp4s(merge_path).items()
+                           if before.get(name) != mtime]
+        except Exception as e:
+            logger.error(f"An error occurred for avid {avid}: {e}")
+            self.log_error(avid)
+            return
 
+        # Blocks while the post stage is backed up, so downloads cannot run arbitrarily far ahead
+        self._post_slots.acquire()
+        future = post_pool.submit(self._postprocess_avid, avid, video_paths)
+        future.add_done_callback(lambda _: self._post_slots.release())
 
-    def generate_and_run_commands(self, avid, proxy, merge_path, audio_only_path, video_only_path):
+    def _postprocess_avid(self, avid, video_paths):
+        try:
+            self.extract_cover_images(video_paths)
+            self.log_progress(avid)
+
+        except Exception as e:
+            logger.error(f"An error occurred for avid {avid}: {e}")
+            self.log_error(avid)
+
+    def _has_finished_videos(self, path):
+        with os.scandir(path) as entries:
+            names = {entry.name for entry in entries}
+        videos = [name for name in names if name.endswith('.mp4')]
+        return bool(videos) and all(os.path.splitext(name)[0] + '.jpg' in names for name in videos)
+
+    def _snapshot_mp4s(self, path):
+        with os.scandir(path) as entries:
+            return {entry.name: entry.stat().st_mtime_ns
+                    for entry in entries if entry.name.endswith('.mp4') and entry.is_file()}
+
+    def generate_and_run_commands(self, avid, proxy, merge_path):
             base_url = f"https://www.bilibili.com/video/av{avid}/"
-            
-            commands = [
-                f"yutto {base_url} --with-metadata -d {merge_path} --proxy {proxy} --no-progress -w"
-            ]
-            
-            for command in commands:
-                logging.info(f"Executing command: {command}")
-                try:
-                    result = subprocess.run(command, shell=True, timeout=180)
-                    if result.returncode != 0:
-                        logging.warning(f"Command failed with return code {result.returncode}. Command: {command}")
-                        self.log_error(avid)
-                except subprocess.TimeoutExpired:
-                    logging.warning(f"Download command timed out for avid {avid}. Command: {command}")
-                    self.log_error(avid)
-                except Exception as e:
-                    logging.error(f"Unexpected error while executing command for avid {avid}: {e}")
+
+            # Passed as an argv list so no shell is spawned and paths with spaces survive intact
+            command = [self.yutto_path, base_url, "--with-metadata", "-d", merge_path, "--proxy", proxy, "--no-progress", "-w"]
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Executing command: {' '.join(command)}")
+            try:
+                # --no-progress already silences the bar; detaching all three std streams keeps
+                # N workers off the tty (and away from the checkpoint prompt's input)
+                result = subprocess.run(command, timeout=180, stdin=subprocess.DEVNULL,
+                                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                if result.returncode != 0:
+                    logger.warning(f"Command failed with return code {result.returncode}. Command: {' '.join(command)}")
                     self.log_error(avid)
+            except subprocess.TimeoutExpired:
+                logger.warning(f"Download command timed out for avid {avid}. Command: {' '.join(command)}")
+                self.log_error(avid)
+            except Exception as e:
+                logger.error(f"Unexpected error while executing command for avid {avid}: {e}")
+                self.log_error(avid)
 
             
-    def extract_cover_image(self, video_path):
-        output_path = os.path.splitext(video_path)[0] + '.jpg'
-        command = [
-            'ffmpeg', '-loglevel', 'quiet', '-i', video_path,
-            '-map', '0:v', '-map', '-0:V', '-c', 'copy',
-            output_path
-        ]
+    def extract_cover_images(self, video_paths):
+        # Covers already on disk (e.g. left by an earlier run) need no ffmpeg call at all
+        pending = [path for path in video_paths if not os.path.exists(os.path.splitext(path)[0] + '.jpg')]
+        # yutto's metadata already names the cover URL; one GET is cheaper than demuxing the mp4
+        pending = [path for path in pending if not self.fetch_cover_from_metadata(path)]
+        if pending:
+            self._extract_covers_with_ffmpeg(pending)
+
+    def fetch_cover_from_metadata(self, video_path):
+        base_path = os.path.splitext(video_path)[0]
+        try:
+            cover_url = ET.parse(base_path + '.nfo').getroot().findtext('thumb')
+        except (OSError, ET.ParseError):
+            return False
+        if not cover_url:
+            return False
+
+        # Runs in the post pool, possibly after the proxy used for the download has expired
+        try:
+            proxy = self.check_ip_validity()
+        except ProxyUnavailableError as e:
+            # The download stage reports the outage and stops the run; the cover can still come from the mp4
+            logger.warning(f'No proxy for cover {cover_url} of {video_path}, falling back to ffmpeg: {e}')
+            return False
+        try:
+            response = self._session.get(cover_url, timeout=30, proxies={'http': proxy, 'https': proxy})
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.warning(f'Failed to download cover {cover_url} for {video_path}, falling back to ffmpeg: {e}')
+            return False
+
+        # Written under a temporary name and renamed, so a kill mid-write never leaves a
+        # truncated .jpg that _has_finished_videos would take as a finished cover
+        tmp_path = base_path + '.part.jpg'
+        with open(tmp_path, 'wb') as f:
+            f.write(response.content)
+        os.replace(tmp_path, base_path + '.jpg')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f'Downloaded cover for {video_path} from {cover_url}')
+        return True
+
+    def _extract_covers_with_ffmpeg(self, pending):
+        # One ffmpeg process for every video of the avid: input i is mapped to its own .jpg output
+        # -nostdin: concurrent ffmpegs must not put the tty in raw mode or read keystrokes.
+        # -y: a .part.jpg left behind by a killed run is simply overwritten.
+        command = [self.ffmpeg_path, '-nostdin', '-y', '-loglevel', 'error']
+        for video_path in pending:
+            command += ['-i', video_path]
+        # Covers are written as <name>.part.jpg (the .jpg suffix keeps ffmpeg's image muxer) and
+        # only renamed to <name>.jpg once ffmpeg has succeeded
+        outputs = {}
+        for i, video_path in enumerate(pending):
+            base_path = os.path.splitext(video_path)[0]
+            outputs[base_path + '.part.jpg'] = base_path + '.jpg'
+            command += ['-map', f'{i}:v', '-map', f'-{i}:V', '-c', 'copy', base_path + '.part.jpg']
+
         start_time = time.time()  
         try:
-            result = subprocess.run(command, check=True, timeout=60)  # Run the command and check for errors
-            end_time = time.time()  # Record the time the extraction was completed
-            elapsed_time = end_time - start_time  # Calculate the time taken for extraction
-            logging.info(f'Successfully extracted cover from {video_path} to {output_path}')
-            logging.info(f'Extraction successful at: {time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(end_time))}')
-            logging.info(f'Time taken for extraction: {elapsed_time:.2f} seconds')
+            # stderr is captured (errors only) so a failure can be logged with ffmpeg's own message
+            result = subprocess.run(command, check=True, timeout=60 * len(pending),
+                                    stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            for tmp_path, output_path in outputs.items():
+                os.replace(tmp_path, output_path)
+            if logger.isEnabledFor(logging.DEBUG):
+                # The log record already carries a timestamp, so only the duration is added
+                logger.debug(f'Extracted {len(pending)} cover(s) in {time.time() - start_time:.2f} seconds: {", ".join(pending)}')
         
         except subprocess.CalledProcessError as e:
-            logging.error(f'Error extracting cover from {video_path}: {e}')
-            self.log_error(os.path.basename(video_path))
+            for tmp_path in outputs:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            if len(pending) == 1:
+                stderr = e.stderr.decode(errors='replace').strip()
+                logger.error(f'Error extracting cover from {pending[0]}: {e} {stderr}')
+                self.log_error(os.path.basename(pending[0]))
+                return
+            # A single video without a cover fails the whole batch; retry one by one to isolate it
+            logger.warning(f'Batch cover extraction failed, retrying {len(pending)} videos individually: {e}')
+            for video_path in pending:
+                self._extract_covers_with_ffmpeg([video_path])
 
     def create_directories(self, avid):
+        # yutto writes the merged video straight into merge/, which is the only directory needed
         merge_path = os.path.join(self.output_dir, str(avid), 'merge')
-        audio_only_path = os.path.join(self.output_dir, str(avid), 'audio_only')
-        video_only_path = os.path.join(self.output_dir, str(avid), 'video_only')
         os.makedirs(merge_path, exist_ok=True)
-        os.makedirs(audio_only_path, exist_ok=True)
-        os.makedirs(video_only_path, exist_ok=True)
-        logging.info(f"Created directories for avid {avid}: {merge_path}, {audio_only_path}, {video_only_path}")
-        return merge_path, audio_only_path, video_only_path
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Created directory for avid {avid}: {merge_path}")
+        return merge_path
 
 if __name__ == '__main__':
     batch_name = sys.argv[1]